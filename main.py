@@ -6,8 +6,11 @@ Entry point for the any-mcp application.
 import sys
 import asyncio
 from any_mcp.main import main
+from any_mcp.core.loop import install_uvloop
 
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        install_uvloop()
     asyncio.run(main())
\ No newline at end of file
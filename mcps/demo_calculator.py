@@ -20,139 +20,142 @@ from mcp.types import Tool, TextContent, CallToolResult
 app = Server("demo-calculator")
 
 
+# Tool schemas are static, so build them once at import time
+TOOLS = (
+    Tool(
+        name="add",
+        description="Add two numbers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"}
+            },
+            "required": ["a", "b"]
+        }
+    ),
+    Tool(
+        name="subtract",
+        description="Subtract two numbers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"}
+            },
+            "required": ["a", "b"]
+        }
+    ),
+    Tool(
+        name="multiply",
+        description="Multiply two numbers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "First number"},
+                "b": {"type": "number", "description": "Second number"}
+            },
+            "required": ["a", "b"]
+        }
+    ),
+    Tool(
+        name="divide",
+        description="Divide two numbers",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "a": {"type": "number", "description": "Dividend"},
+                "b": {"type": "number", "description": "Divisor"}
+            },
+            "required": ["a", "b"]
+        }
+    ),
+    Tool(
+        name="power",
+        description="Raise a number to a power",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "base": {"type": "number", "description": "Base number"},
+                "exponent": {"type": "number", "description": "Exponent"}
+            },
+            "required": ["base", "exponent"]
+        }
+    ),
+    Tool(
+        name="sqrt",
+        description="Calculate square root of a number",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "number": {"type": "number", "description": "Number to calculate square root of"}
+            },
+            "required": ["number"]
+        }
+    )
+)
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available calculator tools."""
-    return [
-        Tool(
-            name="add",
-            description="Add two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"}
-                },
-                "required": ["a", "b"]
-            }
-        ),
-        Tool(
-            name="subtract",
-            description="Subtract two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"}
-                },
-                "required": ["a", "b"]
-            }
-        ),
-        Tool(
-            name="multiply",
-            description="Multiply two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "First number"},
-                    "b": {"type": "number", "description": "Second number"}
-                },
-                "required": ["a", "b"]
-            }
-        ),
-        Tool(
-            name="divide",
-            description="Divide two numbers",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "a": {"type": "number", "description": "Dividend"},
-                    "b": {"type": "number", "description": "Divisor"}
-                },
-                "required": ["a", "b"]
-            }
-        ),
-        Tool(
-            name="power",
-            description="Raise a number to a power",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base": {"type": "number", "description": "Base number"},
-                    "exponent": {"type": "number", "description": "Exponent"}
-                },
-                "required": ["base", "exponent"]
-            }
-        ),
-        Tool(
-            name="sqrt",
-            description="Calculate square root of a number",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "number": {"type": "number", "description": "Number to calculate square root of"}
-                },
-                "required": ["number"]
-            }
-        )
-    ]
+    return list(TOOLS)
+
+
+def _add(arguments):
+    return arguments["a"] + arguments["b"]
+
+
+def _subtract(arguments):
+    return arguments["a"] - arguments["b"]
+
+
+def _multiply(arguments):
+    return arguments["a"] * arguments["b"]
+
+
+def _divide(arguments):
+    if arguments["b"] == 0:
+        raise ValueError("Division by zero")
+    return arguments["a"] / arguments["b"]
+
+
+def _power(arguments):
+    return arguments["base"] ** arguments["exponent"]
+
+
+def _sqrt(arguments):
+    if arguments["number"] < 0:
+        raise ValueError("Cannot calculate square root of negative number")
+    return arguments["number"] ** 0.5
+
+
+# Tool name -> implementation, so dispatch is a single lookup
+HANDLERS = {
+    "add": _add,
+    "subtract": _subtract,
+    "multiply": _multiply,
+    "divide": _divide,
+    "power": _power,
+    "sqrt": _sqrt,
+}
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls."""
+    handler = HANDLERS.get(name)
+    if handler is None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Error: Unknown tool '{name}'")],
+            isError=True
+        )
+
     try:
-        if name == "add":
-            result = arguments["a"] + arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "subtract":
-            result = arguments["a"] - arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "multiply":
-            result = arguments["a"] * arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "divide":
-            if arguments["b"] == 0:
-                return CallToolResult(
-                    content=[TextContent(type="text", text="Error: Division by zero")],
-                    isError=True
-                )
-            result = arguments["a"] / arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "power":
-            result = arguments["base"] ** arguments["exponent"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "sqrt":
-            if arguments["number"] < 0:
-                return CallToolResult(
-                    content=[TextContent(type="text", text="Error: Cannot calculate square root of negative number")],
-                    isError=True
-                )
-            result = arguments["number"] ** 0.5
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        else:
-            return CallToolResult(
-                content=[TextContent(type="text", text=f"Error: Unknown tool '{name}'")],
-                isError=True
-            )
+        result = handler(arguments)
+        return CallToolResult(
+            content=[TextContent(type="text", text=str(result))]
+        )
     
     except Exception as e:
         return CallToolResult(
@@ -172,5 +175,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Standalone server script, so it carries its own copy of any_mcp.core.loop.install_uvloop
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(main())
 
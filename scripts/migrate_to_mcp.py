@@ -725,10 +725,8 @@ def main():
         sys.exit(0 if migration_success else 1)
         
     except Exception as e:
-        logger.error(f"Migration failed: {e}")
-        if args.verbose:
-            import traceback
-            traceback.print_exc()
+        # Let the logging handler format the traceback only when it is wanted
+        logger.error("Migration failed: %s", e, exc_info=args.verbose)
         sys.exit(1)
 
 
@@ -116,7 +116,7 @@ async def list_mcps():
 async def install_mcp(request: MCPInstallRequest):
     """Install a new MCP."""
     try:
-        success = mcp_manager.installer.install_mcp(
+        success = await mcp_manager.installer.install_mcp(
             name=request.name,
             source=request.source,
             description=request.description,
@@ -27,23 +27,32 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
-from typing import Dict, Tuple, Any
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Dict, Tuple
 import difflib
 import re
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from any_mcp.managers.manager import MCPManager
 from any_mcp.core.client import MCPClient
-from any_mcp.servers.connect_server import ServerConnector
-from any_mcp.core.chat import Chat
-from any_mcp.core.claude import Claude
+from any_mcp.core.loop import install_uvloop
 
+from dotenv import load_dotenv
+
+# Every subcommand may start MCPs whose config expands ${VARS} from .env
+load_dotenv()
 
 console = Console()
 
 
+def print_success(result: Any) -> None:
+    # Assemble styled spans directly: tool output is printed verbatim, never parsed as markup
+    console.print(Text.assemble(("Success", "green"), f": {result}"))
+
+
 def parse_kv_args(arg_string: str | None) -> Dict[str, str]:
     args: Dict[str, str] = {}
     if not arg_string:
@@ -91,11 +100,11 @@ async def cmd_install(name: str, source: str, description: str, env_vars_list: l
                 env_vars[k] = v
 
     mgr = MCPManager()
-    ok = mgr.installer.install_mcp(name=name, source=source, description=description, env_vars=env_vars)
+    ok = await mgr.installer.install_mcp(name=name, source=source, description=description, env_vars=env_vars)
     if ok:
-        console.print(f"[green]Installed MCP '{name}'[/green]")
+        console.print(Text(f"Installed MCP '{name}'", style="green"))
     else:
-        console.print(f"[red]Failed to install MCP '{name}'[/red]")
+        console.print(Text(f"Failed to install MCP '{name}'", style="red"))
 
 
 async def ensure_started(mgr: MCPManager, server: str) -> bool:
@@ -105,7 +114,7 @@ async def ensure_started(mgr: MCPManager, server: str) -> bool:
 
 
 async def cmd_start(server: str) -> None:
-    async with MCPManager() as mgr:
+    async with MCPManager(autostart=False) as mgr:
         ok = await ensure_started(mgr, server)
         console.print("[green]Started[/green]" if ok else "[red]Failed[/red]")
 
@@ -117,7 +126,7 @@ async def cmd_stop(server: str) -> None:
 
 
 async def cmd_tools(server: str) -> None:
-    async with MCPManager() as mgr:
+    async with MCPManager(autostart=False) as mgr:
         await ensure_started(mgr, server)
         tools = await mgr.list_mcp_tools(server)
 
@@ -134,25 +143,24 @@ async def cmd_tools(server: str) -> None:
 
 async def cmd_call_server(server: str, tool: str, arg_string: str | None) -> None:
     args = parse_kv_args(arg_string)
-    async with MCPManager() as mgr:
+    async with MCPManager(autostart=False) as mgr:
         await ensure_started(mgr, server)
         result = await mgr.call_mcp(server, tool, args)
         if result is None:
             console.print("[red]Tool call failed[/red]")
             return
-        console.print(f"[green]Success[/green]: {result}")
+        print_success(result)
 
 
 async def cmd_call_script(script: str, tool: str, arg_string: str | None) -> None:
     args = parse_kv_args(arg_string)
-    use_uv = os.getenv("USE_UV", "0") == "1"
-    command, script_args = ("uv", ["run", script]) if use_uv else ("python", [script])
+    command, script_args = ("uv", ["run", script]) if os.getenv("USE_UV", "0") == "1" else ("python", [script])
     async with MCPClient(command=command, args=script_args) as client:
         result = await client.call_tool(tool, args)
         if result is None:
             console.print("[red]Tool call failed[/red]")
             return
-        console.print(f"[green]Success[/green]: {result}")
+        print_success(result)
 
 
 async def cmd_call_docker(image: str, tool: str, arg_string: str | None, env_list: list[str] | None) -> None:
@@ -175,13 +183,16 @@ async def cmd_call_docker(image: str, tool: str, arg_string: str | None, env_lis
         if result is None:
             console.print("[red]Tool call failed[/red]")
             return
-        console.print(f"[green]Success[/green]: {result}")
+        print_success(result)
 
 
 async def cmd_chat(server: str | None, script: str | None, docker: str | None, env_list: list[str] | None) -> None:
-    connector = ServerConnector()
-    from contextlib import AsyncExitStack
+    # Only chat needs the interactive connector and its chat front end
+    from any_mcp.servers.connect_server import ServerConnector
+
+    connector = ServerConnector(autostart=False)
 
+    # One stack owns every resource this session opens and closes them together
     async with AsyncExitStack() as stack:
         if server:
             await stack.enter_async_context(connector.manager)
@@ -276,8 +287,7 @@ async def _connect_ephemeral(script: str | None, docker: str | None, env_list: l
         await client.connect()
         return client
     elif script:
-        use_uv = os.getenv("USE_UV", "0") == "1"
-        command, script_args = ("uv", ["run", script]) if use_uv else ("python", [script])
+        command, script_args = ("uv", ["run", script]) if os.getenv("USE_UV", "0") == "1" else ("python", [script])
         client = MCPClient(command=command, args=script_args)
         await client.connect()
         return client
@@ -305,7 +315,7 @@ async def cmd_nl(server: str | None, script: str | None, docker: str | None, que
     If no good match is found and Claude is configured, we can later route via LLM (future).
     """
     if server:
-        async with MCPManager() as mgr:
+        async with MCPManager(autostart=False) as mgr:
             await ensure_started(mgr, server)
             tools = await mgr.list_mcp_tools(server)
             tool_name, score = _best_tool_match(tools, query)
@@ -318,7 +328,7 @@ async def cmd_nl(server: str | None, script: str | None, docker: str | None, que
             if result is None:
                 console.print("[red]Tool call failed[/red]")
             else:
-                console.print(f"[green]Success[/green]: {result}")
+                print_success(result)
     else:
         # ephemeral client for script/docker
         client = await _connect_ephemeral(script, docker, env_list, module=module, module_args=module_args)
@@ -333,7 +343,7 @@ async def cmd_nl(server: str | None, script: str | None, docker: str | None, que
             if result is None:
                 console.print("[red]Tool call failed[/red]")
             else:
-                console.print(f"[green]Success[/green]: {result}")
+                print_success(result)
         finally:
             await client.cleanup()
 
@@ -392,50 +402,46 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _call_command(args: argparse.Namespace) -> Awaitable[None]:
+    """Route `call` to the handler for whichever target flag was given."""
+    if args.server:
+        return cmd_call_server(args.server, args.tool, args.args)
+    if args.script:
+        return cmd_call_script(args.script, args.tool, args.args)
+    if args.module:
+        mod_args = args.module_args.split() if args.module_args else []
+        # Reuse NL path internals for ephemeral module call by crafting a simple query 'tool=...'
+        q = f"{args.tool} " + (" ".join([f"{k}={v}" for k,v in parse_kv_args(args.args).items()]) if args.args else "")
+        return cmd_nl(None, None, None, q, None, module=args.module, module_args=mod_args)
+    return cmd_call_docker(args.docker, args.tool, args.args, args.env)
+
+
+def _nl_command(args: argparse.Namespace) -> Awaitable[None]:
+    mod_args = args.module_args.split() if getattr(args, "module_args", None) else []
+    return cmd_nl(args.server, args.script, args.docker, args.query, args.env, module=getattr(args, "module", None), module_args=mod_args)
+
+
+# Subcommand name -> coroutine factory taking the parsed arguments
+COMMANDS: Dict[str, Callable[[argparse.Namespace], Awaitable[None]]] = {
+    "list": lambda args: cmd_list(),
+    "install": lambda args: cmd_install(args.name, args.source, args.desc, args.env),
+    "start": lambda args: cmd_start(args.server),
+    "stop": lambda args: cmd_stop(args.server),
+    "tools": lambda args: cmd_tools(args.server),
+    "call": _call_command,
+    # Note: current chat path does not support module directly; fallback by script/module ephemeral client via connect_server if needed later
+    "chat": lambda args: cmd_chat(args.server, args.script, args.docker, args.env),
+    "nl": _nl_command,
+}
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    if args.cmd == "list":
-        asyncio.run(cmd_list())
-        return
-    if args.cmd == "install":
-        asyncio.run(cmd_install(args.name, args.source, args.desc, args.env))
-        return
-    if args.cmd == "start":
-        asyncio.run(cmd_start(args.server))
-        return
-    if args.cmd == "stop":
-        asyncio.run(cmd_stop(args.server))
-        return
-    if args.cmd == "tools":
-        asyncio.run(cmd_tools(args.server))
-        return
-    if args.cmd == "call":
-        if args.server:
-            asyncio.run(cmd_call_server(args.server, args.tool, args.args))
-            return
-        if args.script:
-            asyncio.run(cmd_call_script(args.script, args.tool, args.args))
-            return
-        if args.module:
-            mod_args = args.module_args.split() if args.module_args else []
-            # Reuse NL path internals for ephemeral module call by crafting a simple query 'tool=...'
-            q = f"{args.tool} " + (" ".join([f"{k}={v}" for k,v in parse_kv_args(args.args).items()]) if args.args else "")
-            asyncio.run(cmd_nl(None, None, None, q, None, module=args.module, module_args=mod_args))
-            return
-        if args.docker:
-            asyncio.run(cmd_call_docker(args.docker, args.tool, args.args, args.env))
-            return
-    if args.cmd == "chat":
-        # Note: current chat path does not support module directly; fallback by script/module ephemeral client via connect_server if needed later
-        asyncio.run(cmd_chat(args.server, args.script, args.docker, args.env))
-        return
-    if args.cmd == "nl":
-        mod_args = args.module_args.split() if getattr(args, "module_args", None) else []
-        asyncio.run(cmd_nl(args.server, args.script, args.docker, args.query, args.env, module=getattr(args, "module", None), module_args=mod_args))
-        return
+    install_uvloop()
 
+    asyncio.run(COMMANDS[args.cmd](args))
 
 if __name__ == "__main__":
     main()
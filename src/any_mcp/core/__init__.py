@@ -1,9 +1,23 @@
 """Core functionality for any-mcp package."""
 
+import importlib
+
 from any_mcp.core.client import MCPClient
-from any_mcp.core.claude import Claude
-from any_mcp.core.gemini import Gemini
-from any_mcp.core.cli import CliApp
-from any_mcp.core.cli_chat import CliChat
+
+# LLM providers pull in their vendor SDKs and the chat front end pulls in
+# prompt_toolkit/anthropic, so they are imported on first access
+_LAZY_IMPORTS = {
+    "Claude": "any_mcp.core.claude",
+    "Gemini": "any_mcp.core.gemini",
+    "CliApp": "any_mcp.core.cli",
+    "CliChat": "any_mcp.core.cli_chat",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["MCPClient", "Claude", "Gemini", "CliApp", "CliChat"]
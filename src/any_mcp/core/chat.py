@@ -1,13 +1,14 @@
-from typing import Union
-from any_mcp.core.claude import Claude
-from any_mcp.core.gemini import Gemini
+from typing import TYPE_CHECKING, Union
 from any_mcp.core.client import MCPClient
 from any_mcp.core.tools import ToolManager
-from anthropic.types import MessageParam
+
+if TYPE_CHECKING:
+    from any_mcp.core.claude import Claude
+    from any_mcp.core.gemini import Gemini
 
 
 class Chat:
-    def __init__(self, llm_service: Union[Claude, Gemini], clients: dict[str, MCPClient]):
+    def __init__(self, llm_service: "Union[Claude, Gemini]", clients: dict[str, MCPClient]):
         self.llm_service = llm_service
         self.clients: dict[str, MCPClient] = clients
         self.messages: list = []
@@ -23,10 +24,13 @@ class Chat:
 
         await self._process_query(query)
 
+        # Tool schemas don't change within a query, so list them once rather than per LLM round
+        tools = await ToolManager.get_all_tools(self.clients)
+
         while True:
             response = self.llm_service.chat(
                 messages=self.messages,
-                tools=await ToolManager.get_all_tools(self.clients),
+                tools=tools,
             )
 
             self.llm_service.add_assistant_message(self.messages, response)
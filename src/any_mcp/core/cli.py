@@ -56,9 +56,10 @@ class UnifiedCompleter(Completer):
         if "@" in text_before_cursor:
             last_at_pos = text_before_cursor.rfind("@")
             prefix = text_before_cursor[last_at_pos + 1 :]
+            prefix_lower = prefix.lower()
 
             for resource_id in self.resources:
-                if resource_id.lower().startswith(prefix.lower()):
+                if resource_id.lower().startswith(prefix_lower):
                     yield Completion(
                         resource_id,
                         start_position=-len(prefix),
@@ -97,10 +98,11 @@ class UnifiedCompleter(Completer):
 
             if len(parts) >= 2:
                 doc_prefix = parts[-1]
+                doc_prefix_lower = doc_prefix.lower()
 
                 for resource in self.resources:
                     if "id" in resource and resource["id"].lower().startswith(
-                        doc_prefix.lower()
+                        doc_prefix_lower
                     ):
                         yield Completion(
                             resource["id"],
@@ -1,29 +1,44 @@
-from typing import List, Tuple, Union
+import asyncio
+import time
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from mcp.types import Prompt, PromptMessage
-from anthropic.types import MessageParam
 
 from any_mcp.core.chat import Chat
-from any_mcp.core.claude import Claude
-from any_mcp.core.gemini import Gemini
 from any_mcp.core.client import MCPClient
 
+if TYPE_CHECKING:
+    from anthropic.types import MessageParam
+    from any_mcp.core.claude import Claude
+    from any_mcp.core.gemini import Gemini
+
 
 class CliChat(Chat):
+    # Seconds a fetched document id listing is reused before asking the server again
+    DOC_IDS_TTL = 30.0
+
     def __init__(
         self,
         doc_client: MCPClient,
         clients: dict[str, MCPClient],
-        llm_service: Union[Claude, Gemini],
+        llm_service: "Union[Claude, Gemini]",
     ):
         super().__init__(clients=clients, llm_service=llm_service)
 
         self.doc_client: MCPClient = doc_client
+        self._doc_ids_cache: Optional[Tuple[float, list[str]]] = None
 
     async def list_prompts(self) -> list[Prompt]:
         return await self.doc_client.list_prompts()
 
     async def list_docs_ids(self) -> list[str]:
-        return await self.doc_client.read_resource("docs://documents")
+        now = time.monotonic()
+        if self._doc_ids_cache and now - self._doc_ids_cache[0] < self.DOC_IDS_TTL:
+            return self._doc_ids_cache[1]
+
+        doc_ids = await self.doc_client.read_resource("docs://documents")
+        if doc_ids is not None:
+            self._doc_ids_cache = (now, doc_ids)
+        return doc_ids
 
     async def get_doc_content(self, doc_id: str) -> str:
         return await self.doc_client.read_resource(f"docs://documents/{doc_id}")
@@ -35,14 +50,17 @@ class CliChat(Chat):
 
     async def _extract_resources(self, query: str) -> str:
         mentions = [word[1:] for word in query.split() if word.startswith("@")]
+        if not mentions:
+            return ""
 
-        doc_ids = await self.list_docs_ids()
-        mentioned_docs: list[Tuple[str, str]] = []
+        doc_ids = await self.list_docs_ids() or []
+        mentioned_ids = [doc_id for doc_id in doc_ids if doc_id in mentions]
 
-        for doc_id in doc_ids:
-            if doc_id in mentions:
-                content = await self.get_doc_content(doc_id)
-                mentioned_docs.append((doc_id, content))
+        # Each document read is an independent round trip, so issue them together
+        contents = await asyncio.gather(
+            *(self.get_doc_content(doc_id) for doc_id in mentioned_ids)
+        )
+        mentioned_docs: list[Tuple[str, str]] = list(zip(mentioned_ids, contents))
 
         return "".join(
             f'\n<document id="{doc_id}">\n{content}\n</document>\n'
@@ -90,45 +108,32 @@ class CliChat(Chat):
         self.messages.append({"role": "user", "content": prompt})
 
 
+def _get_field(item, key: str, default=None):
+    """Read a field from either a plain dict or an MCP content model."""
+    if isinstance(item, dict):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
 def convert_prompt_message_to_message_param(
     prompt_message: "PromptMessage",
-) -> MessageParam:
+) -> "MessageParam":
     role = "user" if prompt_message.role == "user" else "assistant"
 
     content = prompt_message.content
 
     # Check if content is a dict-like object with a "type" field
     if isinstance(content, dict) or hasattr(content, "__dict__"):
-        content_type = (
-            content.get("type", None)
-            if isinstance(content, dict)
-            else getattr(content, "type", None)
-        )
-        if content_type == "text":
-            content_text = (
-                content.get("text", "")
-                if isinstance(content, dict)
-                else getattr(content, "text", "")
-            )
-            return {"role": role, "content": content_text}
+        if _get_field(content, "type") == "text":
+            return {"role": role, "content": _get_field(content, "text", "")}
 
     if isinstance(content, list):
-        text_blocks = []
-        for item in content:
-            # Check if item is a dict-like object with a "type" field
-            if isinstance(item, dict) or hasattr(item, "__dict__"):
-                item_type = (
-                    item.get("type", None)
-                    if isinstance(item, dict)
-                    else getattr(item, "type", None)
-                )
-                if item_type == "text":
-                    item_text = (
-                        item.get("text", "")
-                        if isinstance(item, dict)
-                        else getattr(item, "text", "")
-                    )
-                    text_blocks.append({"type": "text", "text": item_text})
+        text_blocks = [
+            {"type": "text", "text": _get_field(item, "text", "")}
+            for item in content
+            if (isinstance(item, dict) or hasattr(item, "__dict__"))
+            and _get_field(item, "type") == "text"
+        ]
 
         if text_blocks:
             return {"role": role, "content": text_blocks}
@@ -138,7 +143,7 @@ def convert_prompt_message_to_message_param(
 
 def convert_prompt_messages_to_message_params(
     prompt_messages: List[PromptMessage],
-) -> List[MessageParam]:
+) -> "List[MessageParam]":
     return [
         convert_prompt_message_to_message_param(msg) for msg in prompt_messages
     ]
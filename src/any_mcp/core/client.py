@@ -1,30 +1,53 @@
 import sys
 import asyncio
 import logging
-from typing import Optional, Any
+import time
+from typing import Any, Awaitable, Callable, Optional
 from contextlib import AsyncExitStack
+from datetime import timedelta
 from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
+from any_mcp.core.loop import install_uvloop
 
 logger = logging.getLogger(__name__)
 
+# Server notifications that invalidate a cached listing, keyed to that listing
+_LIST_CHANGED = {
+    types.ToolListChangedNotification: "tools/list",
+    types.PromptListChangedNotification: "prompts/list",
+}
+
 
 class MCPClient:
     """
     Enhanced MCP client with complete tool discovery and calling capabilities.
     Provides robust error handling and logging for production use.
     """
+    __slots__ = ("_command", "_args", "_env", "_session", "_exit_stack", "_inflight",
+                 "_read_timeout", "_listings")
+
+    # Seconds a tool/prompt listing is reused if the server sends no list_changed
+    LISTING_TTL = 60.0
+
     def __init__(
         self,
         command: str,
         args: list[str],
         env: Optional[dict] = None,
+        read_timeout: Optional[float] = None,
     ):
         self._command = command
         self._args = args
         self._env = env
         self._session: Optional[ClientSession] = None
         self._exit_stack: AsyncExitStack = AsyncExitStack()
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Listing method -> (fetched_at, items)
+        self._listings: dict[str, tuple[float, list]] = {}
+        # Per-request read timeout in seconds; None waits indefinitely
+        self._read_timeout: Optional[timedelta] = (
+            timedelta(seconds=read_timeout) if read_timeout is not None else None
+        )
 
     async def connect(self):
         """Establish connection to the MCP server."""
@@ -39,12 +62,17 @@ class MCPClient:
             )
             _stdio, _write = stdio_transport
             self._session = await self._exit_stack.enter_async_context(
-                ClientSession(_stdio, _write)
+                ClientSession(
+                    _stdio,
+                    _write,
+                    read_timeout_seconds=self._read_timeout,
+                    message_handler=self._handle_message,
+                )
             )
             await self._session.initialize()
-            logger.info(f"Connected to MCP server: {self._command}")
+            logger.info("Connected to MCP server: %s", self._command)
         except Exception as e:
-            logger.error(f"Failed to connect to MCP server: {e}")
+            logger.error("Failed to connect to MCP server: %s", e)
             raise
 
     def session(self) -> ClientSession:
@@ -54,14 +82,43 @@ class MCPClient:
             )
         return self._session
 
-    async def list_tools(self) -> list[types.Tool]:
+    async def _handle_message(self, message: Any) -> None:
+        """Drop a cached listing when the server reports that it changed."""
+        key = _LIST_CHANGED.get(type(getattr(message, "root", None)))
+        if key:
+            self._listings.pop(key, None)
+
+    async def _cached_listing(
+        self, key: str, fetch: Callable[[], Awaitable[list]], refresh: bool
+    ) -> list:
+        """Return a cached listing, fetching it when missing, stale or refresh is set."""
+        cached = self._listings.get(key)
+        if not refresh and cached and time.monotonic() - cached[0] < self.LISTING_TTL:
+            return list(cached[1])
+        return await self._coalesce(key, fetch)
+
+    async def _coalesce(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight request between concurrent identical callers."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return await asyncio.shield(future)
+
+    async def list_tools(self, refresh: bool = False) -> list[types.Tool]:
         """Return a list of tools defined by the MCP server."""
+        return await self._cached_listing("tools/list", self._fetch_tools, refresh)
+
+    async def _fetch_tools(self) -> list[types.Tool]:
         try:
             session = self.session()
             response = await session.list_tools()
+            self._listings["tools/list"] = (time.monotonic(), list(response.tools))
             return response.tools
         except Exception as e:
-            logger.error(f"Failed to list tools: {e}")
+            logger.error("Failed to list tools: %s", e)
             return []
 
     async def call_tool(
@@ -73,17 +130,32 @@ class MCPClient:
             response = await session.call_tool(tool_name, tool_input)
             return response
         except Exception as e:
-            logger.error(f"Failed to call tool {tool_name}: {e}")
+            logger.error("Failed to call tool %s: %s", tool_name, e)
             return None
 
-    async def list_prompts(self) -> list[types.Prompt]:
+    async def call_tools(
+        self, calls: list[tuple[str, dict]]
+    ) -> list[types.CallToolResult | None]:
+        """Call several tools at once, returning results in the order of calls."""
+        # Requests are pipelined over the one session and matched back by request id
+        return list(
+            await asyncio.gather(
+                *(self.call_tool(tool_name, tool_input) for tool_name, tool_input in calls)
+            )
+        )
+
+    async def list_prompts(self, refresh: bool = False) -> list[types.Prompt]:
         """Return a list of prompts defined by the MCP server."""
+        return await self._cached_listing("prompts/list", self._fetch_prompts, refresh)
+
+    async def _fetch_prompts(self) -> list[types.Prompt]:
         try:
             session = self.session()
             response = await session.list_prompts()
+            self._listings["prompts/list"] = (time.monotonic(), list(response.prompts))
             return response.prompts
         except Exception as e:
-            logger.error(f"Failed to list prompts: {e}")
+            logger.error("Failed to list prompts: %s", e)
             return []
 
     async def get_prompt(self, prompt_name: str, args: dict[str, str]) -> list[types.PromptMessage]:
@@ -93,7 +165,7 @@ class MCPClient:
             response = await session.get_prompt(prompt_name, args)
             return response.messages
         except Exception as e:
-            logger.error(f"Failed to get prompt {prompt_name}: {e}")
+            logger.error("Failed to get prompt %s: %s", prompt_name, e)
             return []
 
     async def read_resource(self, uri: str) -> Any:
@@ -103,7 +175,7 @@ class MCPClient:
             response = await session.read_resource(uri)
             return response.contents
         except Exception as e:
-            logger.error(f"Failed to read resource {uri}: {e}")
+            logger.error("Failed to read resource %s: %s", uri, e)
             return None
 
     async def cleanup(self):
@@ -111,9 +183,10 @@ class MCPClient:
         try:
             await self._exit_stack.aclose()
             self._session = None
+            self._listings.clear()
             logger.info("MCP client cleaned up successfully")
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
     async def __aenter__(self):
         await self.connect()
@@ -136,4 +209,6 @@ async def main():
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        install_uvloop()
     asyncio.run(main())
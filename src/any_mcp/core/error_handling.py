@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import random
 import time
-from typing import Any, Callable, Optional, TypeVar, Union
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar, Union
 from functools import wraps
 from enum import Enum
 
@@ -97,8 +98,15 @@ def with_timeout(timeout_seconds: float):
     return decorator
 
 
-def with_retry(max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0):
-    """Decorator to add retry logic to functions."""
+def with_retry(max_attempts: int = 3, delay: float = 1.0, backoff_factor: float = 2.0,
+               max_delay: float = 30.0, jitter: bool = False):
+    """
+    Decorator to add retry logic to functions.
+
+    Waits grow by backoff_factor up to max_delay. With jitter enabled each wait
+    is drawn uniformly from [0, wait] so concurrent callers don't retry in lockstep.
+    A server-provided retry_after on MCPRateLimitError always takes precedence.
+    """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -118,9 +126,11 @@ def with_retry(max_attempts: int = 3, delay: float = 1.0, backoff_factor: float
                     if isinstance(e, MCPRateLimitError) and e.retry_after:
                         wait_time = e.retry_after
                     else:
-                        wait_time = current_delay
+                        wait_time = min(current_delay, max_delay)
+                        if jitter:
+                            wait_time = random.uniform(0, wait_time)
                     
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time}s...")
+                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.2f}s...")
                     await asyncio.sleep(wait_time)
                     current_delay *= backoff_factor
                     
@@ -217,6 +227,67 @@ class CircuitBreaker:
         return wrapper
 
 
+class RateLimiter:
+    """Token bucket limiting MCP operations to `rate` calls per `period` seconds."""
+
+    def __init__(self, rate: float = 3.0, period: float = 1.0):
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        # The bucket must hold at least one whole token or a slow rate (<1) never admits a call
+        self.capacity = max(1.0, rate)
+        self.fill_rate = rate / period
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.fill_rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            await self.acquire()
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """
+    Await several awaitables with at most `limit` of them running at once.
+    
+    Args:
+        aws: Awaitables to run; coroutines are not started until a slot frees up
+        limit: Maximum number running concurrently
+        
+    Returns:
+        Results in the same order as aws
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(run(aw) for aw in aws)))
+
+
 async def safe_call_with_fallback(primary_func: Callable, fallback_func: Callable = None, 
                                  *args, **kwargs) -> Any:
     """
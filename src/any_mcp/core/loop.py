@@ -0,0 +1,18 @@
+import sys
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when it is installed; returns whether it was.
+
+    Call from an entry point before asyncio.run(). uvloop has no Windows
+    support, so this is a no-op there.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,38 +1,114 @@
+import asyncio
 import json
-from typing import Optional, Literal, List
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Literal, List
 from mcp.types import CallToolResult, Tool, TextContent
 from any_mcp.core.client import MCPClient
-from anthropic.types import Message, ToolResultBlockParam
+from any_mcp.core.error_handling import gather_bounded
+
+if TYPE_CHECKING:
+    from anthropic.types import Message, ToolResultBlockParam
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        # Compact like orjson; the result is LLM input, so whitespace is wasted tokens
+        return json.dumps(obj, separators=(",", ":"))
+
+# jsonschema is an optional extra, not part of the locked dependencies; when it
+# is not installed, validation is skipped and tool inputs go to the server unchecked
+try:
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+except ImportError:
+    validator_for = None
+
+# Upper bound on cached validators; refreshed listings bring new Tool entries
+_MAX_VALIDATORS = 256
+# id(Tool) -> (Tool, validator or None if its schema is unusable). The Tool is
+# held so its id cannot be reused by another object while the entry is cached.
+_validators: dict[int, tuple[Tool, Any]] = {}
+
+
+def _tool_validator(tool: Tool) -> Any:
+    """Return the cached validator for a tool's input schema, building it once."""
+    entry = _validators.get(id(tool))
+    if entry is not None and entry[0] is tool:
+        return entry[1]
+
+    validator = None
+    schema = tool.inputSchema
+    if validator_for is not None and schema:
+        try:
+            validator_cls = validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+        except Exception:
+            # A schema jsonschema can't use is the server's business; don't block the call
+            validator = None
+
+    if len(_validators) >= _MAX_VALIDATORS:
+        _validators.pop(next(iter(_validators)))
+    _validators[id(tool)] = (tool, validator)
+    return validator
+
+
+def _validate_tool_input(tool: Tool, tool_input: dict) -> Optional[str]:
+    """Return an error message if tool_input does not match the tool's input schema."""
+    validator = _tool_validator(tool)
+    if validator is None:
+        return None
+    try:
+        error = best_match(validator.iter_errors(tool_input))
+    except Exception:
+        # Unresolvable $refs and unknown types only surface while validating
+        _validators[id(tool)] = (tool, None)
+        return None
+    return None if error is None else error.message
 
 
 class ToolManager:
+    # Upper bound on tool calls from one assistant message running at once
+    MAX_CONCURRENT_TOOL_CALLS = 8
+
     @classmethod
     async def get_all_tools(cls, clients: dict[str, MCPClient]) -> list[Tool]:
         """Gets all tools from the provided clients."""
-        tools = []
-        for client in clients.values():
-            tool_models = await client.list_tools()
-            tools += [
-                {
-                    "name": t.name,
-                    "description": t.description,
-                    "input_schema": t.inputSchema,
-                }
-                for t in tool_models
-            ]
-        return tools
+        # Each client is a separate server, so list them concurrently
+        tool_lists = await asyncio.gather(
+            *(client.list_tools() for client in clients.values())
+        )
+        return [
+            {
+                "name": t.name,
+                "description": t.description,
+                "input_schema": t.inputSchema,
+            }
+            for tool_models in tool_lists
+            for t in tool_models
+        ]
 
     @classmethod
-    async def _find_client_with_tool(
-        cls, clients: list[MCPClient], tool_name: str
-    ) -> Optional[MCPClient]:
-        """Finds the first client that has the specified tool."""
-        for client in clients:
-            tools = await client.list_tools()
-            tool = next((t for t in tools if t.name == tool_name), None)
-            if tool:
-                return client
-        return None
+    async def _index_tools(
+        cls, clients: dict[str, MCPClient]
+    ) -> dict[str, tuple[MCPClient, Tool]]:
+        """Maps each tool name to the first client that provides it."""
+        client_list = list(clients.values())
+        tool_lists = await asyncio.gather(
+            *(client.list_tools() for client in client_list)
+        )
+        index: dict[str, tuple[MCPClient, Tool]] = {}
+        for client, tools in zip(client_list, tool_lists):
+            for tool in tools:
+                index.setdefault(tool.name, (client, tool))
+        return index
 
     @classmethod
     def _build_tool_result_part(
@@ -40,7 +116,7 @@ class ToolManager:
         tool_use_id: str,
         text: str,
         status: Literal["success"] | Literal["error"],
-    ) -> ToolResultBlockParam:
+    ) -> "ToolResultBlockParam":
         """Builds a tool result part dictionary."""
         return {
             "tool_use_id": tool_use_id,
@@ -51,57 +127,74 @@ class ToolManager:
 
     @classmethod
     async def execute_tool_requests(
-        cls, clients: dict[str, MCPClient], message: Message
-    ) -> List[ToolResultBlockParam]:
+        cls, clients: dict[str, MCPClient], message: "Message"
+    ) -> "List[ToolResultBlockParam]":
         """Executes a list of tool requests against the provided clients."""
         tool_requests = [
             block for block in message.content if block.type == "tool_use"
         ]
-        tool_result_blocks: list[ToolResultBlockParam] = []
-        for tool_request in tool_requests:
-            tool_use_id = tool_request.id
-            tool_name = tool_request.name
-            tool_input = tool_request.input
-
-            client = await cls._find_client_with_tool(
-                list(clients.values()), tool_name
+        if not tool_requests:
+            return []
+
+        # Resolve tool names once for the whole message instead of scanning per request
+        tool_index = await cls._index_tools(clients)
+        # Tool calls are independent I/O, so run them together; results keep request order
+        return await gather_bounded(
+            (
+                cls._execute_tool_request(tool_index, tool_request)
+                for tool_request in tool_requests
+            ),
+            cls.MAX_CONCURRENT_TOOL_CALLS,
+        )
+
+    @classmethod
+    async def _execute_tool_request(
+        cls,
+        tool_index: dict[str, tuple[MCPClient, Tool]],
+        tool_request: Any,
+    ) -> "ToolResultBlockParam":
+        """Executes a single tool request and builds its result part."""
+        tool_use_id = tool_request.id
+        tool_name = tool_request.name
+        tool_input = tool_request.input
+
+        client, tool = tool_index.get(tool_name, (None, None))
+
+        if not client:
+            return cls._build_tool_result_part(
+                tool_use_id, "Could not find that tool", "error"
+            )
+
+        # Reject malformed arguments before spending a server round trip
+        validation_error = _validate_tool_input(tool, tool_input)
+        if validation_error:
+            return cls._build_tool_result_part(
+                tool_use_id,
+                _dumps({"error": f"Invalid arguments for '{tool_name}': {validation_error}"}),
+                "error",
             )
 
-            if not client:
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id, "Could not find that tool", "error"
-                )
-                tool_result_blocks.append(tool_result_part)
-                continue
-
-            try:
-                tool_output: CallToolResult | None = await client.call_tool(
-                    tool_name, tool_input
-                )
-                items = []
-                if tool_output:
-                    items = tool_output.content
-                content_list = [
-                    item.text for item in items if isinstance(item, TextContent)
-                ]
-                content_json = json.dumps(content_list)
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id,
-                    content_json,
-                    "error"
-                    if tool_output and tool_output.isError
-                    else "success",
-                )
-            except Exception as e:
-                error_message = f"Error executing tool '{tool_name}': {e}"
-                print(error_message)
-                tool_result_part = cls._build_tool_result_part(
-                    tool_use_id,
-                    json.dumps({"error": error_message}),
-                    "error"
-                    if tool_output and tool_output.isError
-                    else "success",
-                )
-
-            tool_result_blocks.append(tool_result_part)
-        return tool_result_blocks
+        try:
+            tool_output: CallToolResult | None = await client.call_tool(tool_name, tool_input)
+            items = []
+            if tool_output:
+                items = tool_output.content
+            content_list = [
+                item.text for item in items if isinstance(item, TextContent)
+            ]
+            content_json = _dumps(content_list)
+            return cls._build_tool_result_part(
+                tool_use_id,
+                content_json,
+                "error"
+                if tool_output and tool_output.isError
+                else "success",
+            )
+        except Exception as e:
+            error_message = f"Error executing tool '{tool_name}': {e}"
+            logger.error("Error executing tool '%s': %s", tool_name, e)
+            return cls._build_tool_result_part(
+                tool_use_id,
+                _dumps({"error": error_message}),
+                "error",
+            )
@@ -7,8 +7,6 @@ from contextlib import AsyncExitStack
 # for mcp functionality
 from any_mcp.core.client import MCPClient
 from any_mcp.managers.manager import MCPManager
-from any_mcp.core.claude import Claude
-from any_mcp.core.gemini import Gemini
 
 # for better CLI visualization
 from any_mcp.core.cli_chat import CliChat
@@ -35,7 +33,7 @@ gemini_api_key = config.GEMINI_API_KEY
                                                                                       
  1. Import all necessary modules and classes, including:                              
     - Standard libraries (asyncio, sys, os, dotenv, contextlib)                       
-    - Core MCP classes (MCPClient, MCPManager, Claude, Gemini)                        
+    - Core MCP classes (MCPClient, MCPManager); Claude/Gemini load lazily                        
     - CLI utilities (CliChat, CliApp)                                                 
     - Configuration loader (config.py)                                               
                                                                                       
@@ -49,7 +47,8 @@ gemini_api_key = config.GEMINI_API_KEY
     - Uses a hashmap (provider_checks) to map provider to required values.            
     - Raises assertion error or ValueError if config is missing or provider is wrong.
                                                                                       
- 4. Immediately call check_llm_provider_config() to validate config at startup.        
+ 4. check_llm_provider_config() is called at the start of main(), not at import,  
+    so importing this module (tooling, tests) does not validate the environment.    
                                                                                       
  5. Define initialize_llm_service_based_on_llm_provider(llm_provider):                
     - Uses a hashmap (llm_service_map) to map provider to the correct LLM service     
@@ -113,8 +112,15 @@ def check_llm_provider_config():
     else:
         raise ValueError(f"Unsupported LLM_PROVIDER: {llm_provider}. Use '{claude_provider}' or '{gemini_provider}'")
 
-# Call the function to check config
-check_llm_provider_config()
+def _create_claude():
+    # Imported here so the Anthropic SDK only loads when Claude is selected
+    from any_mcp.core.claude import Claude
+    return Claude(model=claude_model)
+
+def _create_gemini():
+    # Imported here so the Google SDK only loads when Gemini is selected
+    from any_mcp.core.gemini import Gemini
+    return Gemini(model=gemini_model, api_key=gemini_api_key)
 
 def initialize_llm_service_based_on_llm_provider(llm_provider):
     '''
@@ -123,11 +129,11 @@ def initialize_llm_service_based_on_llm_provider(llm_provider):
               to add to hashmap, no need for hard-coding one more if else statment 
     '''
     llm_service_map = {
-        claude_provider : Claude(model=claude_model),
-        gemini_provider : Gemini(model=gemini_model, api_key=gemini_api_key),
+        claude_provider : _create_claude,
+        gemini_provider : _create_gemini,
     }
     if llm_provider in llm_service_map:
-        return llm_service_map[llm_provider]
+        return llm_service_map[llm_provider]()
     else:
         raise ValueError(f"Unsupported LLM provider: {llm_provider}")
 
@@ -207,6 +213,15 @@ async def display_mcp_status(mcp_manager, clients_count):
             print(f"   ⚠️  Could not get MCP status: {e}")
 
 async def main():
+    # Run new tasks eagerly up to their first real await (Python 3.12+), so
+    # fan-out like concurrent tool calls skips a scheduler round trip when the
+    # work finishes immediately
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Validate provider config before starting anything
+    check_llm_provider_config()
+
     # Initialize LLM service based on provider
     llm_service = initialize_llm_service_based_on_llm_provider(llm_provider)
 
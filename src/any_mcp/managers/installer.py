@@ -1,16 +1,23 @@
-import os
 import json
 import yaml
 import shutil
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+from any_mcp.core.error_handling import gather_bounded
+
 logger = logging.getLogger(__name__)
 
+# Use libyaml's C loader/dumper when PyYAML was built with it; same safe semantics, much faster
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 class MCPType(Enum):
     DOCKER = "docker"
@@ -18,16 +25,27 @@ class MCPType(Enum):
     REGISTRY = "registry"
 
 
-@dataclass
+# Source scheme -> MCP type, as accepted by MCPInstaller.install_mcp
+SOURCE_PREFIXES = (
+    ("docker://", MCPType.DOCKER),
+    ("local://", MCPType.LOCAL),
+    ("registry://", MCPType.REGISTRY),
+)
+
+
+@dataclass(slots=True)
 class MCPConfig:
     name: str
     type: MCPType
     source: str
-    env_vars: Dict[str, str] = None
+    env_vars: Dict[str, str] = field(default_factory=dict)
     enabled: bool = True
     description: str = ""
+    # Seconds to wait for any one response from the server; None waits indefinitely
+    read_timeout: Optional[float] = None
     
     def __post_init__(self):
+        # Configs loaded from YAML may carry an explicit null
         if self.env_vars is None:
             self.env_vars = {}
 
@@ -37,6 +55,9 @@ class MCPInstaller:
     Multi-source MCP package installer supporting Docker, local files, and registry.
     Provides YAML-based configuration management and environment variable support.
     """
+    # Upper bound on installs (e.g. docker pulls) running at once in install_mcps
+    MAX_CONCURRENT_INSTALLS = 4
+
     def __init__(self, config_path: str = "mcp_config.yaml"):
         self.config_path = Path(config_path)
         self.mcps_dir = Path("mcps")
@@ -49,7 +70,7 @@ class MCPInstaller:
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
-                    config_data = yaml.safe_load(f) or {}
+                    config_data = yaml.load(f, Loader=_YamlLoader) or {}
                 
                 for name, mcp_data in config_data.get('installed_mcps', {}).items():
                     self.installed_mcps[name] = MCPConfig(
@@ -58,7 +79,8 @@ class MCPInstaller:
                         source=mcp_data['source'],
                         env_vars=mcp_data.get('env_vars', {}),
                         enabled=mcp_data.get('enabled', True),
-                        description=mcp_data.get('description', '')
+                        description=mcp_data.get('description', ''),
+                        read_timeout=mcp_data.get('read_timeout')
                     )
                 logger.info(f"Loaded {len(self.installed_mcps)} MCPs from config")
             except Exception as e:
@@ -76,7 +98,8 @@ class MCPInstaller:
                     'source': mcp.source,
                     'env_vars': mcp.env_vars,
                     'enabled': mcp.enabled,
-                    'description': mcp.description
+                    'description': mcp.description,
+                    **({'read_timeout': mcp.read_timeout} if mcp.read_timeout is not None else {})
                 }
                 for name, mcp in self.installed_mcps.items()
             }
@@ -84,13 +107,13 @@ class MCPInstaller:
         
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False)
+                yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False)
             logger.info(f"Saved config to {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
             raise
 
-    def install_mcp(self, name: str, source: str, description: str = "", env_vars: Dict[str, str] = None) -> bool:
+    async def install_mcp(self, name: str, source: str, description: str = "", env_vars: Dict[str, str] = None) -> bool:
         """
         Install an MCP from various sources.
         
@@ -107,23 +130,21 @@ class MCPInstaller:
             env_vars = {}
             
         try:
-            # Parse source type
-            if source.startswith("docker://"):
-                mcp_type = MCPType.DOCKER
-                source_path = source.replace("docker://", "")
-            elif source.startswith("local://"):
-                mcp_type = MCPType.LOCAL
-                source_path = source.replace("local://", "")
+            # Parse source type; only the leading scheme is stripped
+            for prefix, mcp_type in SOURCE_PREFIXES:
+                if source.startswith(prefix):
+                    source_path = source[len(prefix):]
+                    break
+            else:
+                raise ValueError(f"Invalid source format: {source}")
+
+            if mcp_type == MCPType.LOCAL:
                 # Validate local file exists
                 if not Path(source_path).exists():
                     raise FileNotFoundError(f"Local MCP file not found: {source_path}")
-            elif source.startswith("registry://"):
-                mcp_type = MCPType.REGISTRY
-                source_path = source.replace("registry://", "")
+            elif mcp_type == MCPType.REGISTRY:
                 # TODO: Implement registry lookup
                 raise NotImplementedError("Registry sources not yet implemented")
-            else:
-                raise ValueError(f"Invalid source format: {source}")
 
             # Create MCP config
             mcp_config = MCPConfig(
@@ -136,7 +157,7 @@ class MCPInstaller:
 
             # Install based on type
             if mcp_type == MCPType.DOCKER:
-                success = self._install_docker_mcp(mcp_config)
+                success = await self._install_docker_mcp(mcp_config)
             elif mcp_type == MCPType.LOCAL:
                 success = self._install_local_mcp(mcp_config)
             else:
@@ -155,16 +176,40 @@ class MCPInstaller:
             logger.error(f"Error installing MCP {name}: {e}")
             return False
 
-    def _install_docker_mcp(self, mcp: MCPConfig) -> bool:
+    async def install_mcps(self, specs: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Install several MCPs concurrently.
+        
+        Args:
+            specs: install_mcp keyword arguments, one dict per MCP
+            
+        Returns:
+            List[bool]: Install result for each spec, in order
+        """
+        return await gather_bounded(
+            (self.install_mcp(**spec) for spec in specs), self.MAX_CONCURRENT_INSTALLS
+        )
+
+    async def _run_docker(self, docker: str, *args: str) -> int:
+        """Run a docker command without blocking the event loop; returns its exit code."""
+        proc = await asyncio.create_subprocess_exec(
+            docker, *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await proc.wait()
+
+    async def _install_docker_mcp(self, mcp: MCPConfig) -> bool:
         """Install a Docker-based MCP."""
         try:
-            # Check if Docker is available
-            result = os.system("docker --version > /dev/null 2>&1")
-            if result != 0:
+            # Check if Docker is available; looked up per install so a later install
+            # in a long-running process sees docker once it has been installed
+            docker = shutil.which("docker")
+            if docker is None:
                 raise RuntimeError("Docker is not available")
 
             # Try to pull the image to validate it exists
-            pull_result = os.system(f"docker pull {mcp.source} > /dev/null 2>&1")
+            pull_result = await self._run_docker(docker, "pull", mcp.source)
             if pull_result != 0:
                 logger.warning(f"Could not pull image {mcp.source}, will try to run anyway")
 
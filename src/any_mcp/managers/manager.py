@@ -1,10 +1,12 @@
 import asyncio
 import logging
 import os
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from contextlib import AsyncExitStack
 
 from any_mcp.core.client import MCPClient
+from any_mcp.core.error_handling import gather_bounded
 from any_mcp.managers.installer import MCPInstaller, MCPConfig, MCPType
 from mcp import types
 
@@ -16,11 +18,20 @@ class MCPManager:
     MCP lifecycle manager for starting, stopping, and monitoring MCP servers.
     Provides health checks, tool orchestration, and status reporting.
     """
-    def __init__(self, config_path: str = "config/mcp_config.yaml"):
+    # Seconds a successful health check is trusted before probing the server again
+    HEALTH_CHECK_TTL = 30.0
+    # Upper bound on tool calls in flight at once in call_mcps
+    MAX_CONCURRENT_CALLS = 8
+
+    def __init__(self, config_path: str = "config/mcp_config.yaml", autostart: bool = True):
         self.installer = MCPInstaller(config_path)
+        # When False, initialize() starts nothing and MCPs are set up on demand
+        self.autostart = autostart
         self.active_clients: Dict[str, MCPClient] = {}
         self.exit_stack = AsyncExitStack()
         self._initialized = False
+        # mcp_name -> (checked_at, client) for the last successful health check
+        self._health_cache: Dict[str, Tuple[float, MCPClient]] = {}
 
     async def initialize(self):
         """Initialize the MCP manager and start enabled MCPs."""
@@ -28,8 +39,8 @@ class MCPManager:
             return
 
         try:
-            enabled_mcps = self.installer.get_enabled_mcps()
-            logger.info(f"Initializing {len(enabled_mcps)} enabled MCPs")
+            enabled_mcps = self.installer.get_enabled_mcps() if self.autostart else []
+            logger.info("Initializing %s enabled MCPs", len(enabled_mcps))
 
             # Start all enabled MCPs
             for mcp_config in enabled_mcps:
@@ -38,7 +49,7 @@ class MCPManager:
             self._initialized = True
             logger.info("MCP manager initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize MCP manager: {e}")
+            logger.error("Failed to initialize MCP manager: %s", e)
             raise
 
     async def setup_mcp(self, mcp_name: str) -> bool:
@@ -52,16 +63,16 @@ class MCPManager:
             bool: True if setup successful
         """
         if mcp_name in self.active_clients:
-            logger.info(f"MCP {mcp_name} is already active")
+            logger.info("MCP %s is already active", mcp_name)
             return True
 
         mcp_config = self.installer.get_mcp_config(mcp_name)
         if not mcp_config:
-            logger.error(f"MCP {mcp_name} not found in installed MCPs")
+            logger.error("MCP %s not found in installed MCPs", mcp_name)
             return False
 
         if not mcp_config.enabled:
-            logger.warning(f"MCP {mcp_name} is disabled")
+            logger.warning("MCP %s is disabled", mcp_name)
             return False
 
         try:
@@ -71,21 +82,21 @@ class MCPManager:
             elif mcp_config.type == MCPType.LOCAL:
                 client = await self._setup_local_mcp(mcp_config)
             else:
-                logger.error(f"Unsupported MCP type: {mcp_config.type}")
+                logger.error("Unsupported MCP type: %s", mcp_config.type)
                 return False
 
             if client:
                 # Register with exit stack for cleanup
                 await self.exit_stack.enter_async_context(client)
                 self.active_clients[mcp_name] = client
-                logger.info(f"Successfully setup MCP: {mcp_name}")
+                logger.info("Successfully setup MCP: %s", mcp_name)
                 return True
             else:
-                logger.error(f"Failed to create client for MCP: {mcp_name}")
+                logger.error("Failed to create client for MCP: %s", mcp_name)
                 return False
 
         except Exception as e:
-            logger.error(f"Error setting up MCP {mcp_name}: {e}")
+            logger.error("Error setting up MCP %s: %s", mcp_name, e)
             return False
 
     async def _setup_docker_mcp(self, mcp_config: MCPConfig) -> Optional[MCPClient]:
@@ -109,7 +120,8 @@ class MCPManager:
                       for item in ["-e", f"{key}={value}"]],
                     mcp_config.source
                 ],
-                env=env
+                env=env,
+                read_timeout=mcp_config.read_timeout
             )
 
             # Test connection
@@ -117,7 +129,7 @@ class MCPManager:
             return client
 
         except Exception as e:
-            logger.error(f"Failed to setup Docker MCP {mcp_config.name}: {e}")
+            logger.error("Failed to setup Docker MCP %s: %s", mcp_config.name, e)
             return None
 
     async def _setup_local_mcp(self, mcp_config: MCPConfig) -> Optional[MCPClient]:
@@ -140,29 +152,32 @@ class MCPManager:
                 client = MCPClient(
                     command="npx",
                     args=source_parts[1:],  # Everything after "npx"
-                    env=env
+                    env=env,
+                    read_timeout=mcp_config.read_timeout
                 )
             elif mcp_config.source.endswith(".py"):
                 # Handle Python scripts
-                use_uv = os.getenv("USE_UV", "0") == "1"
-                if use_uv:
+                if os.getenv("USE_UV", "0") == "1":
                     client = MCPClient(
                         command="uv",
                         args=["run", mcp_config.source],
-                        env=env
+                        env=env,
+                        read_timeout=mcp_config.read_timeout
                     )
                 else:
                     client = MCPClient(
                         command="python",
                         args=[mcp_config.source],
-                        env=env
+                        env=env,
+                        read_timeout=mcp_config.read_timeout
                     )
             else:
                 # Handle other commands (parse the full command)
                 client = MCPClient(
                     command=source_parts[0],
                     args=source_parts[1:] if len(source_parts) > 1 else [],
-                    env=env
+                    env=env,
+                    read_timeout=mcp_config.read_timeout
                 )
 
             # Test connection
@@ -170,7 +185,7 @@ class MCPManager:
             return client
 
         except Exception as e:
-            logger.error(f"Failed to setup local MCP {mcp_config.name}: {e}")
+            logger.error("Failed to setup local MCP %s: %s", mcp_config.name, e)
             return None
 
     async def call_mcp(self, mcp_name: str, tool_name: str, args: Dict[str, Any]) -> Optional[types.CallToolResult]:
@@ -186,18 +201,34 @@ class MCPManager:
             CallToolResult or None if failed
         """
         if mcp_name not in self.active_clients:
-            logger.error(f"MCP {mcp_name} is not active")
+            logger.error("MCP %s is not active", mcp_name)
             return None
 
         try:
             client = self.active_clients[mcp_name]
             result = await client.call_tool(tool_name, args)
-            logger.info(f"Successfully called {tool_name} on {mcp_name}")
+            logger.info("Successfully called %s on %s", tool_name, mcp_name)
             return result
         except Exception as e:
-            logger.error(f"Failed to call tool {tool_name} on {mcp_name}: {e}")
+            logger.error("Failed to call tool %s on %s: %s", tool_name, mcp_name, e)
             return None
 
+    async def call_mcps(
+        self, calls: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> List[Optional[types.CallToolResult]]:
+        """
+        Call several tools, possibly across MCPs, with bounded concurrency.
+        
+        Args:
+            calls: (mcp_name, tool_name, args) tuples
+            
+        Returns:
+            One CallToolResult (or None if failed) per call, in the order given
+        """
+        return await gather_bounded(
+            (self.call_mcp(*call) for call in calls), self.MAX_CONCURRENT_CALLS
+        )
+
     async def list_mcp_tools(self, mcp_name: str) -> List[types.Tool]:
         """
         List available tools for a specific MCP.
@@ -209,7 +240,7 @@ class MCPManager:
             List of available tools
         """
         if mcp_name not in self.active_clients:
-            logger.error(f"MCP {mcp_name} is not active")
+            logger.error("MCP %s is not active", mcp_name)
             return []
 
         try:
@@ -217,7 +248,7 @@ class MCPManager:
             tools = await client.list_tools()
             return tools
         except Exception as e:
-            logger.error(f"Failed to list tools for {mcp_name}: {e}")
+            logger.error("Failed to list tools for %s: %s", mcp_name, e)
             return []
 
     async def list_all_tools(self) -> Dict[str, List[types.Tool]]:
@@ -252,17 +283,17 @@ class MCPManager:
             bool: True if stopped successfully
         """
         if mcp_name not in self.active_clients:
-            logger.warning(f"MCP {mcp_name} is not active")
+            logger.warning("MCP %s is not active", mcp_name)
             return False
 
         try:
             client = self.active_clients[mcp_name]
             await client.cleanup()
             del self.active_clients[mcp_name]
-            logger.info(f"Successfully stopped MCP: {mcp_name}")
+            logger.info("Successfully stopped MCP: %s", mcp_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to stop MCP {mcp_name}: {e}")
+            logger.error("Failed to stop MCP %s: %s", mcp_name, e)
             return False
 
     async def restart_mcp(self, mcp_name: str) -> bool:
@@ -291,13 +322,21 @@ class MCPManager:
         if mcp_name not in self.active_clients:
             return False
 
+        client = self.active_clients[mcp_name]
+        now = time.monotonic()
+        cached = self._health_cache.get(mcp_name)
+        # A restarted MCP gets a new client, which invalidates the cached result
+        if cached and cached[1] is client and now - cached[0] < self.HEALTH_CHECK_TTL:
+            return True
+
         try:
-            client = self.active_clients[mcp_name]
-            # Try to list tools as a health check
-            tools = await client.list_tools()
+            # Try to list tools as a health check, bypassing the client's listing cache
+            tools = await client.list_tools(refresh=True)
+            self._health_cache[mcp_name] = (now, client)
             return True
         except Exception as e:
-            logger.warning(f"Health check failed for {mcp_name}: {e}")
+            self._health_cache.pop(mcp_name, None)
+            logger.warning("Health check failed for %s: %s", mcp_name, e)
             return False
 
     async def get_mcp_status(self) -> Dict[str, Dict[str, Any]]:
@@ -308,11 +347,15 @@ class MCPManager:
             Dictionary with MCP status information
         """
         status = {}
-        
-        # Get installed MCPs
-        for mcp_config in self.installer.list_installed_mcps():
+        installed = self.installer.list_installed_mcps()
+
+        # Probe every active MCP at once rather than one round trip after another
+        active = [c.name for c in installed if c.name in self.active_clients]
+        healthy = dict(zip(active, await asyncio.gather(*(self.health_check(n) for n in active))))
+
+        for mcp_config in installed:
             is_active = mcp_config.name in self.active_clients
-            is_healthy = await self.health_check(mcp_config.name) if is_active else False
+            is_healthy = healthy.get(mcp_config.name, False)
             
             status[mcp_config.name] = {
                 "type": mcp_config.type.value,
@@ -334,7 +377,7 @@ class MCPManager:
         """
         # Placeholder for LLM integration
         # In the future, this would register tools with specific LLM frameworks
-        logger.info(f"LLM registration for {mcp_name} - placeholder implementation")
+        logger.info("LLM registration for %s - placeholder implementation", mcp_name)
 
     async def cleanup(self):
         """Clean up all active MCP clients."""
@@ -344,7 +387,7 @@ class MCPManager:
             self._initialized = False
             logger.info("MCP manager cleaned up successfully")
         except Exception as e:
-            logger.error(f"Error during MCP manager cleanup: {e}")
+            logger.error("Error during MCP manager cleanup: %s", e)
 
     async def __aenter__(self):
         await self.initialize()
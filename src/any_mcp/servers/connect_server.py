@@ -21,9 +21,7 @@ from typing import Optional, Dict, Any
 
 from any_mcp.core.client import MCPClient
 from any_mcp.managers.manager import MCPManager
-from any_mcp.core.claude import Claude
-from any_mcp.core.cli_chat import CliChat
-from any_mcp.core.cli import CliApp
+from any_mcp.core.loop import install_uvloop
 
 from dotenv import load_dotenv
 
@@ -32,19 +30,20 @@ load_dotenv()
 class ServerConnector:
     """Handles connection to specific MCP servers"""
     
-    def __init__(self):
+    def __init__(self, autostart: bool = True):
         self.client: Optional[MCPClient] = None
-        self.manager = MCPManager()
+        # Connecting to one server only needs that server; listing wants them all running
+        self.manager = MCPManager(autostart=autostart)
         
     async def connect_to_configured_server(self, server_name: str) -> bool:
         """Connect to a server defined in mcp_config.yaml"""
         try:
-            await self.manager.initialize()
-            if server_name not in self.manager.active_clients:
+            # Start only the requested server rather than every enabled one
+            if not await self.manager.setup_mcp(server_name):
                 print(f"❌ Server '{server_name}' not found or failed to start")
                 print("Available servers:")
-                for name in self.manager.get_active_mcps():
-                    print(f"  - {name}")
+                for mcp in self.manager.installer.get_enabled_mcps():
+                    print(f"  - {mcp.name}")
                 return False
             
             self.client = self.manager.active_clients[server_name]
@@ -63,9 +62,7 @@ class ServerConnector:
                 return False
             
             # Determine if we should use uv or python
-            use_uv = os.getenv("USE_UV", "0") == "1"
-            
-            if use_uv:
+            if os.getenv("USE_UV", "0") == "1":
                 command, args = "uv", ["run", script_path]
             else:
                 command, args = "python", [script_path]
@@ -114,16 +111,16 @@ class ServerConnector:
             async with self.manager:
                 status = await self.manager.get_mcp_status()
                 
-                print("\n📋 Available MCP Servers:")
-                print("-" * 50)
-                
+                # Build the listing up front and write it in one go
+                lines = ["\n📋 Available MCP Servers:", "-" * 50]
                 for name, info in status.items():
                     emoji = "✅" if info.get("active") and info.get("healthy") else "❌"
                     enabled = "✓" if info.get("enabled") else "✗"
-                    print(f"{emoji} {name:<15} [{info.get('type', 'unknown'):<6}] (enabled: {enabled})")
+                    lines.append(f"{emoji} {name:<15} [{info.get('type', 'unknown'):<6}] (enabled: {enabled})")
                     if info.get("description"):
-                        print(f"    {info['description']}")
-                    print()
+                        lines.append(f"    {info['description']}")
+                    lines.append("")
+                print("\n".join(lines))
                 
         except Exception as e:
             print(f"❌ Failed to list servers: {e}")
@@ -137,24 +134,24 @@ class ServerConnector:
         try:
             # List available tools
             tools = await self.client.list_tools()
-            print(f"\n🔧 Available Tools ({len(tools)}):")
-            print("-" * 30)
+            lines = [f"\n🔧 Available Tools ({len(tools)}):", "-" * 30]
             for tool in tools:
-                print(f"  • {tool.name}")
+                lines.append(f"  • {tool.name}")
                 if tool.description:
-                    print(f"    {tool.description}")
-                print()
+                    lines.append(f"    {tool.description}")
+                lines.append("")
+            print("\n".join(lines))
             
             # List available prompts
             prompts = await self.client.list_prompts()
             if prompts:
-                print(f"\n💭 Available Prompts ({len(prompts)}):")
-                print("-" * 30)
+                lines = [f"\n💭 Available Prompts ({len(prompts)}):", "-" * 30]
                 for prompt in prompts:
-                    print(f"  • {prompt.name}")
+                    lines.append(f"  • {prompt.name}")
                     if prompt.description:
-                        print(f"    {prompt.description}")
-                    print()
+                        lines.append(f"    {prompt.description}")
+                    lines.append("")
+                print("\n".join(lines))
                     
         except Exception as e:
             print(f"❌ Failed to get server info: {e}")
@@ -173,13 +170,18 @@ class ServerConnector:
             if claude_model and anthropic_api_key:
                 print("🤖 Starting enhanced chat with Claude integration...")
                 try:
+                    # Imported here so the plain tool loop never loads the LLM stack
+                    from any_mcp.core.claude import Claude
+                    from any_mcp.core.cli_chat import CliChat
+                    from any_mcp.core.cli import CliApp
+
                     claude_service = Claude(model=claude_model)
                     clients = {"target_server": self.client}
                     
                     chat = CliChat(
                         doc_client=self.client,
                         clients=clients,
-                        claude_service=claude_service,
+                        llm_service=claude_service,
                     )
                     
                     cli = CliApp(chat)
@@ -213,38 +215,23 @@ class ServerConnector:
     
     async def _basic_interaction_loop(self):
         """Basic interaction loop without Claude integration"""
+        # Command verb -> handler taking the rest of the input line
+        commands = {
+            "tools": self._cmd_tools,
+            "prompts": self._cmd_prompts,
+            "call": self._cmd_call,
+        }
         while True:
             try:
                 user_input = input("> ").strip()
+                verb, _, rest = user_input.partition(" ")
+                verb = verb.lower()
                 
-                if user_input.lower() in ['quit', 'exit']:
+                if verb in ('quit', 'exit'):
                     break
-                elif user_input.lower() == 'tools':
-                    tools = await self.client.list_tools()
-                    print(f"Available tools: {[tool.name for tool in tools]}")
-                elif user_input.lower() == 'prompts':
-                    prompts = await self.client.list_prompts()
-                    print(f"Available prompts: {[prompt.name for prompt in prompts]}")
-                elif user_input.startswith('call '):
-                    parts = user_input[5:].split(' ', 1)
-                    tool_name = parts[0]
-                    args = {}
-                    if len(parts) > 1:
-                        # Simple argument parsing (key=value format)
-                        try:
-                            for arg in parts[1].split(','):
-                                if '=' in arg:
-                                    key, value = arg.strip().split('=', 1)
-                                    args[key.strip()] = value.strip()
-                        except:
-                            print("❌ Invalid argument format. Use: key=value,key2=value2")
-                            continue
-                    
-                    result = await self.client.call_tool(tool_name, args)
-                    if result:
-                        print(f"Result: {result}")
-                    else:
-                        print("❌ Tool call failed")
+                handler = commands.get(verb)
+                if handler:
+                    await handler(rest)
                 else:
                     print("❌ Unknown command. Try 'tools', 'prompts', 'call <tool>', or 'quit'")
                     
@@ -253,6 +240,41 @@ class ServerConnector:
             except Exception as e:
                 print(f"❌ Error: {e}")
 
+    async def _cmd_tools(self, rest: str):
+        """List tool names exposed by the connected server"""
+        tools = await self.client.list_tools()
+        print(f"Available tools: {[tool.name for tool in tools]}")
+
+    async def _cmd_prompts(self, rest: str):
+        """List prompt names exposed by the connected server"""
+        prompts = await self.client.list_prompts()
+        print(f"Available prompts: {[prompt.name for prompt in prompts]}")
+
+    async def _cmd_call(self, rest: str):
+        """Call a tool with key=value,key2=value2 arguments"""
+        parts = rest.split(' ', 1)
+        tool_name = parts[0]
+        if not tool_name:
+            print("❌ Usage: call <tool_name> <args>")
+            return
+        args = {}
+        if len(parts) > 1:
+            # Simple argument parsing (key=value format)
+            try:
+                for arg in parts[1].split(','):
+                    if '=' in arg:
+                        key, value = arg.strip().split('=', 1)
+                        args[key.strip()] = value.strip()
+            except:
+                print("❌ Invalid argument format. Use: key=value,key2=value2")
+                return
+        
+        result = await self.client.call_tool(tool_name, args)
+        if result:
+            print(f"Result: {result}")
+        else:
+            print("❌ Tool call failed")
+
 
 async def main():
     parser = argparse.ArgumentParser(
@@ -311,7 +333,7 @@ async def main():
     
     args = parser.parse_args()
     
-    connector = ServerConnector()
+    connector = ServerConnector(autostart=args.list)
     
     # Handle list command
     if args.list:
@@ -394,6 +416,8 @@ async def main():
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        install_uvloop()
     
     try:
         asyncio.run(main())
@@ -0,0 +1,40 @@
+"""
+Unit tests for the any-mcp CLI entry point
+"""
+import os
+import sys
+import importlib
+import subprocess
+from unittest.mock import patch
+
+import any_mcp.cli.main as cli_main
+
+
+class TestCliMain:
+    """Test cases for the any-mcp-cli module."""
+
+    def test_import_loads_dotenv(self):
+        """Test importing the CLI loads .env before any subcommand runs."""
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            importlib.reload(cli_main)
+
+        mock_load_dotenv.assert_called_once_with()
+
+    def test_every_subcommand_dispatches(self):
+        """Test each parser subcommand has an entry in the dispatch table."""
+        parser = cli_main.build_parser()
+        choices = parser._subparsers._group_actions[0].choices
+
+        assert set(choices) == set(cli_main.COMMANDS)
+
+    def test_chat_stack_defers_anthropic(self):
+        """Test the chat modules import without loading the Anthropic SDK."""
+        code = (
+            "import sys, any_mcp.core.cli_chat, any_mcp.core.tools; "
+            "sys.exit('anthropic' in sys.modules)"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+        result = subprocess.run([sys.executable, "-c", code], env=env)
+
+        assert result.returncode == 0
@@ -94,7 +94,42 @@ class TestMCPClient:
         tools = await client.list_tools()
         
         assert tools == []
-    
+
+    @pytest.mark.asyncio
+    async def test_list_tools_coalesces_concurrent_calls(self, client, mock_session):
+        """Test concurrent tool listings share a single server request."""
+        client._session = mock_session
+        mock_tools = [types.Tool(name="test_tool", description="Test tool", inputSchema={})]
+        mock_session.list_tools.return_value = types.ListToolsResult(tools=mock_tools)
+
+        results = await asyncio.gather(client.list_tools(), client.list_tools())
+
+        assert results == [mock_tools, mock_tools]
+        mock_session.list_tools.assert_called_once()
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_list_tools_cached_until_list_changed(self, client, mock_session):
+        """Test tool listings are reused until the server reports a change."""
+        client._session = mock_session
+        mock_tools = [types.Tool(name="test_tool", description="Test tool", inputSchema={})]
+        mock_session.list_tools.return_value = types.ListToolsResult(tools=mock_tools)
+
+        await client.list_tools()
+        await client.list_tools()
+        assert mock_session.list_tools.call_count == 1
+
+        await client._handle_message(
+            types.ServerNotification(
+                types.ToolListChangedNotification(method="notifications/tools/list_changed")
+            )
+        )
+        await client.list_tools()
+        assert mock_session.list_tools.call_count == 2
+
+        await client.list_tools(refresh=True)
+        assert mock_session.list_tools.call_count == 3
+
     @pytest.mark.asyncio
     async def test_call_tool_success(self, client, mock_session, sample_tool_call, sample_tool_result):
         """Test successful tool execution."""
@@ -115,7 +150,20 @@ class TestMCPClient:
         result = await client.call_tool("test_tool_1", {"input": "test"})
         
         assert result is None
-    
+
+    @pytest.mark.asyncio
+    async def test_call_tools_keeps_order(self, client, mock_session):
+        """Test batched tool calls return one result per call, in order."""
+        client._session = mock_session
+        mock_session.call_tool.side_effect = lambda name, args: CallToolResult(
+            content=[TextContent(type="text", text=name)]
+        )
+
+        results = await client.call_tools([("first", {}), ("second", {"x": 1})])
+
+        assert [r.content[0].text for r in results] == ["first", "second"]
+        assert mock_session.call_tool.call_count == 2
+
     @pytest.mark.asyncio
     async def test_list_prompts_success(self, client, mock_session):
         """Test successful prompt listing."""
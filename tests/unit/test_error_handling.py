@@ -0,0 +1,116 @@
+"""
+Unit tests for MCP error handling helpers
+"""
+import time
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from any_mcp.core.error_handling import RateLimiter, gather_bounded
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Drive the limiter from a fake clock; sleeping advances it instantly."""
+        now = [0.0]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            now[0] += delay
+
+        fake_time = SimpleNamespace(monotonic=lambda: now[0], time=time.time)
+        with patch("any_mcp.core.error_handling.time", fake_time), \
+                patch("any_mcp.core.error_handling.asyncio.sleep", fake_sleep):
+            yield sleeps
+
+    @pytest.mark.asyncio
+    async def test_bursts_then_throttles(self, clock):
+        """Test a full bucket admits `rate` calls at once, then paces the rest."""
+        limiter = RateLimiter(rate=2, period=1.0)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        assert clock == []
+        assert limiter.tokens == pytest.approx(0)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        # Each further token takes half a second to refill at 2 per second
+        assert clock == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert limiter.tokens == pytest.approx(0)
+
+    @pytest.mark.asyncio
+    async def test_rate_below_one(self, clock):
+        """Test a fractional rate still admits calls instead of waiting forever."""
+        limiter = RateLimiter(rate=0.5, period=1.0)
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        assert clock == [pytest.approx(2.0)]
+
+    def test_rejects_non_positive_rate(self):
+        """Test a zero rate is rejected up front."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self, clock):
+        """Test `async with` takes a token from the bucket."""
+        limiter = RateLimiter(rate=2, period=60)
+
+        async with limiter as acquired:
+            assert acquired is limiter
+
+        assert limiter.tokens == pytest.approx(1)
+
+    @pytest.mark.asyncio
+    async def test_decorator(self, clock):
+        """Test a decorated coroutine takes a token per call and keeps its result."""
+        limiter = RateLimiter(rate=3, period=60)
+
+        @limiter
+        async def double(x):
+            return x * 2
+
+        assert await double(2) == 4
+        assert await double(3) == 6
+        assert limiter.tokens == pytest.approx(1)
+
+
+class TestGatherBounded:
+    """Test cases for gather_bounded."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_ordered(self):
+        """Test no more than `limit` awaitables run at once and results keep order."""
+        in_flight = peak = 0
+
+        async def work(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish out of order so ordering comes from gather, not timing
+            for _ in range(5 - i):
+                await asyncio.sleep(0)
+            in_flight -= 1
+            return i
+
+        results = await gather_bounded((work(i) for i in range(5)), limit=2)
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors(self):
+        """Test an exception from one awaitable is raised to the caller."""
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await gather_bounded([fail()], limit=1)
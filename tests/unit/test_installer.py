@@ -0,0 +1,90 @@
+"""
+Unit tests for MCP installer functionality
+"""
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from any_mcp.managers.installer import MCPInstaller, MCPConfig, MCPType
+
+
+class TestMCPInstaller:
+    """Test cases for MCPInstaller class."""
+
+    @pytest.fixture
+    def installer(self, tmp_path, monkeypatch):
+        """Create an MCPInstaller whose config and mcps dir live in tmp_path."""
+        monkeypatch.chdir(tmp_path)
+        return MCPInstaller(str(tmp_path / "mcp_config.yaml"))
+
+    @staticmethod
+    def _docker(returncode: int):
+        """Patch docker lookup and subprocess creation; yields the exec mock."""
+        proc = MagicMock()
+        proc.wait = AsyncMock(return_value=returncode)
+        exec_mock = AsyncMock(return_value=proc)
+        which = patch("any_mcp.managers.installer.shutil.which", return_value="/usr/bin/docker")
+        create = patch("any_mcp.managers.installer.asyncio.create_subprocess_exec", exec_mock)
+        return which, create, exec_mock
+
+    @pytest.mark.asyncio
+    async def test_install_docker_mcp(self, installer):
+        """Test a docker install pulls the image without blocking and is saved."""
+        which, create, exec_mock = self._docker(0)
+        with which, create:
+            ok = await installer.install_mcp("img", "docker://img:latest", "Image")
+
+        assert ok is True
+        assert exec_mock.call_args.args == ("/usr/bin/docker", "pull", "img:latest")
+        assert installer.get_mcp_config("img").type == MCPType.DOCKER
+        assert installer.config_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_install_docker_mcp_pull_failure(self, installer):
+        """Test a failed pull still installs; the image may exist locally."""
+        which, create, _ = self._docker(1)
+        with which, create:
+            ok = await installer.install_mcp("img", "docker://img:latest")
+
+        assert ok is True
+        assert installer.get_mcp_config("img") is not None
+
+    @pytest.mark.asyncio
+    async def test_install_docker_mcp_without_docker(self, installer):
+        """Test a docker install fails cleanly when docker is not on PATH."""
+        with patch("any_mcp.managers.installer.shutil.which", return_value=None):
+            ok = await installer.install_mcp("img", "docker://img:latest")
+
+        assert ok is False
+        assert installer.get_mcp_config("img") is None
+
+    @pytest.mark.asyncio
+    async def test_install_mcps_keeps_order(self, installer):
+        """Test batched installs return one result per spec, in spec order."""
+        async def install_docker(mcp):
+            await asyncio.sleep(0)
+            return mcp.name != "bad"
+
+        specs = [
+            {"name": "img0", "source": "docker://img0"},
+            {"name": "bad", "source": "docker://bad"},
+            {"name": "img1", "source": "docker://img1"},
+            {"name": "invalid", "source": "ftp://nowhere"},
+        ]
+
+        with patch.object(installer, "_install_docker_mcp", side_effect=install_docker):
+            results = await installer.install_mcps(specs)
+
+        assert results == [True, False, True, False]
+        assert sorted(c.name for c in installer.list_installed_mcps()) == ["img0", "img1"]
+
+    def test_read_timeout_round_trips(self, installer):
+        """Test a configured read_timeout survives a save and reload."""
+        installer.installed_mcps["slow"] = MCPConfig(
+            name="slow", type=MCPType.LOCAL, source="./slow.py", read_timeout=2.5
+        )
+        installer._save_config()
+
+        reloaded = MCPInstaller(str(installer.config_path))
+
+        assert reloaded.get_mcp_config("slow").read_timeout == 2.5
@@ -233,6 +233,50 @@ class TestMCPManager:
         
         assert result is None
     
+    @pytest.mark.asyncio
+    async def test_setup_local_mcp_passes_read_timeout(self, tmp_path):
+        """Test a configured read_timeout reaches the MCP client."""
+        manager = MCPManager(str(tmp_path / "mcp_config.yaml"))
+        config = MCPConfig(
+            name="slow", type=MCPType.LOCAL, source="node server.js", read_timeout=2.5
+        )
+
+        with patch("any_mcp.managers.manager.MCPClient") as mock_client_class:
+            mock_client_class.return_value.connect = AsyncMock()
+            await manager._setup_local_mcp(config)
+
+        assert mock_client_class.call_args.kwargs["read_timeout"] == 2.5
+
+    @pytest.mark.asyncio
+    async def test_call_mcps_keeps_order(self, tmp_path):
+        """Test batched calls return one result per call, None for inactive MCPs."""
+        manager = MCPManager(str(tmp_path / "mcp_config.yaml"))
+        client = AsyncMock(spec=MCPClient)
+        client.call_tool.side_effect = lambda tool_name, args: tool_name
+        manager.active_clients["test-mcp"] = client
+
+        results = await manager.call_mcps(
+            [("test-mcp", "first", {}), ("missing", "tool", {}), ("test-mcp", "second", {})]
+        )
+
+        assert results == ["first", None, "second"]
+
+    @pytest.mark.asyncio
+    async def test_health_check_cached(self, tmp_path):
+        """Test a healthy result is reused until the client changes."""
+        manager = MCPManager(str(tmp_path / "mcp_config.yaml"))
+        client = AsyncMock(spec=MCPClient)
+        manager.active_clients["test-mcp"] = client
+
+        assert await manager.health_check("test-mcp") is True
+        assert await manager.health_check("test-mcp") is True
+        client.list_tools.assert_called_once()
+
+        restarted = AsyncMock(spec=MCPClient)
+        manager.active_clients["test-mcp"] = restarted
+        assert await manager.health_check("test-mcp") is True
+        restarted.list_tools.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_active_mcps(self, manager):
         """Test getting active MCPs."""
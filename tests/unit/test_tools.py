@@ -0,0 +1,148 @@
+"""
+Unit tests for ToolManager tool discovery and execution
+"""
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from mcp import types
+from mcp.types import CallToolResult, TextContent
+
+from any_mcp.core.client import MCPClient
+from any_mcp.core.tools import ToolManager
+
+
+class TestToolManager:
+    """Test cases for ToolManager class."""
+
+    @pytest.fixture
+    def add_tool(self):
+        """Create a tool with a strict input schema."""
+        return types.Tool(
+            name="add",
+            description="Add two numbers",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "a": {"type": "number"},
+                    "b": {"type": "number"},
+                },
+                "required": ["a", "b"],
+            },
+        )
+
+    @pytest.fixture
+    def client(self, add_tool):
+        """Create a mock MCPClient exposing the add tool."""
+        client = AsyncMock(spec=MCPClient)
+        client.list_tools.return_value = [add_tool]
+        client.call_tool.return_value = CallToolResult(
+            content=[TextContent(type="text", text="3")]
+        )
+        return client
+
+    def _message(self, tool_input: dict):
+        """Build a minimal assistant message with one tool_use block."""
+        block = SimpleNamespace(
+            type="tool_use", id="toolu_1", name="add", input=tool_input
+        )
+        return SimpleNamespace(content=[block])
+
+    @pytest.mark.asyncio
+    async def test_get_all_tools(self, client):
+        """Test tool schemas are flattened for the LLM."""
+        tools = await ToolManager.get_all_tools({"calc": client})
+
+        assert tools == [
+            {
+                "name": "add",
+                "description": "Add two numbers",
+                "input_schema": client.list_tools.return_value[0].inputSchema,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_valid_request(self, client):
+        """Test a valid tool request reaches the client."""
+        results = await ToolManager.execute_tool_requests(
+            {"calc": client}, self._message({"a": 1, "b": 2})
+        )
+
+        client.call_tool.assert_called_once_with("add", {"a": 1, "b": 2})
+        assert results[0]["is_error"] is False
+        assert json.loads(results[0]["content"]) == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_execute_multiple_requests_keeps_order(self, client):
+        """Test results line up with tool_use blocks when run concurrently."""
+        message = SimpleNamespace(
+            content=[
+                SimpleNamespace(
+                    type="tool_use", id=f"toolu_{i}", name="add", input={"a": i, "b": 1}
+                )
+                for i in range(3)
+            ]
+        )
+
+        results = await ToolManager.execute_tool_requests({"calc": client}, message)
+
+        assert [r["tool_use_id"] for r in results] == ["toolu_0", "toolu_1", "toolu_2"]
+        assert client.call_tool.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_invalid_request_skips_call(self, client):
+        """Test arguments failing the input schema never reach the client."""
+        pytest.importorskip("jsonschema")
+        results = await ToolManager.execute_tool_requests(
+            {"calc": client}, self._message({"a": 1})
+        )
+
+        client.call_tool.assert_not_called()
+        assert results[0]["is_error"] is True
+        assert "Invalid arguments for 'add'" in results[0]["content"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"type": "object", "properties": {"a": {"type": "int"}}},
+            {"type": "object", "properties": {"a": {"$ref": "#/$defs/missing"}}},
+        ],
+    )
+    async def test_execute_unusable_schema_still_calls(self, client, schema):
+        """Test a schema jsonschema cannot use is skipped rather than failing the turn."""
+        pytest.importorskip("jsonschema")
+        client.list_tools.return_value = [
+            types.Tool(name="add", description="Add two numbers", inputSchema=schema)
+        ]
+
+        results = await ToolManager.execute_tool_requests(
+            {"calc": client}, self._message({"a": 1, "b": 2})
+        )
+
+        client.call_tool.assert_called_once_with("add", {"a": 1, "b": 2})
+        assert results[0]["is_error"] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_raising_call_is_error(self, client):
+        """Test a tool call that raises comes back flagged as an error."""
+        client.call_tool.side_effect = RuntimeError("server went away")
+
+        results = await ToolManager.execute_tool_requests(
+            {"calc": client}, self._message({"a": 1, "b": 2})
+        )
+
+        assert results[0]["is_error"] is True
+        assert "server went away" in json.loads(results[0]["content"])["error"]
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown_tool(self, client):
+        """Test requests for unknown tools return an error block."""
+        client.list_tools.return_value = []
+
+        results = await ToolManager.execute_tool_requests(
+            {"calc": client}, self._message({"a": 1, "b": 2})
+        )
+
+        assert results[0]["is_error"] is True
+        assert results[0]["content"] == "Could not find that tool"
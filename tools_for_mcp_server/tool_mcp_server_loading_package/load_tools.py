@@ -1,14 +1,21 @@
 import os
+import copy
 import json
+from functools import lru_cache
 
-def load_all_tools(all_tool_dir_path):
-    output_tool_list = []
 
-    # dynamically load all the tools
-    for filename in os.listdir(all_tool_dir_path):
+@lru_cache(maxsize=None)
+def _load_tool_schemas(all_tool_dir_path):
+    # parse every tool file once per directory; schemas are static on disk
+    schemas = []
+    for filename in sorted(os.listdir(all_tool_dir_path)):
         if filename.endswith(".json"):
             filepath = os.path.join(all_tool_dir_path, filename)
             with open(filepath, 'r') as f:
-                tool_data = json.load(f)
-                output_tool_list.append(tool_data)
-    return output_tool_list
\ No newline at end of file
+                schemas.append(json.load(f))
+    return tuple(schemas)
+
+
+def load_all_tools(all_tool_dir_path):
+    # hand out deep copies so callers can edit the list or any schema without touching the cache
+    return copy.deepcopy(list(_load_tool_schemas(all_tool_dir_path)))